@@ -8,6 +8,7 @@ to control the physical LED grid.
 
 import sys
 import json
+import logging
 import time
 import argparse
 import struct
@@ -36,6 +37,8 @@ except ImportError:
 
         np = MockNumpy()
 
+logger = logging.getLogger("legrid-local-controller")
+
 
 class MockNeoPixel:
     """Mock NeoPixel for development without hardware"""
@@ -52,11 +55,16 @@ class MockNeoPixel:
             self.show()
 
     def show(self):
-        # In mock mode, just print the first few pixels for debugging
+        # In mock mode, log the first few pixels for debugging; the scan over
+        # every pixel is skipped entirely unless debug logging is enabled
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         active_pixels = [p for p in self.pixels if p != (0, 0, 0)]
         if active_pixels:
-            print(
-                f"Mock LED update: {len(active_pixels)} active pixels, first few: {active_pixels[:5]}"
+            logger.debug(
+                "Mock LED update: %d active pixels, first few: %s",
+                len(active_pixels),
+                active_pixels[:5],
             )
 
     def __setitem__(self, index, value):
@@ -107,7 +115,7 @@ class LEDController:
     def set_frame(self, pixels: List[Tuple[int, int, int]]):
         """Set the entire LED frame"""
         if len(pixels) != self.led_count:
-            print(f"Warning: Expected {self.led_count} pixels, got {len(pixels)}")
+            logger.warning("Expected %d pixels, got %d", self.led_count, len(pixels))
             return
 
         # Update all pixels
@@ -129,9 +137,17 @@ def main():
     parser.add_argument("--height", type=int, default=24, help="Grid height")
     parser.add_argument("--led-pin", type=int, default=18, help="GPIO pin for LED data")
     parser.add_argument("--led-count", type=int, default=600, help="Number of LEDs")
+    parser.add_argument(
+        "--debug", action="store_true", help="Enable per-frame debug logging"
+    )
 
     args = parser.parse_args()
 
+    logging.basicConfig(
+        level=logging.DEBUG if args.debug else logging.WARNING,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
     # Initialize controller
     controller = LEDController(args.width, args.height, args.led_pin, args.led_count)
 
@@ -146,6 +162,9 @@ def main():
 
     print("LED controller ready. Waiting for frame data...")
 
+    # Green/blue channels of the test pattern never change, so build them once
+    test_pattern_gb = [((i * 2) % 256, (i * 3) % 256) for i in range(args.led_count)]
+
     # Main loop - read frame data from stdin
     try:
         while True:
@@ -165,19 +184,18 @@ def main():
             try:
                 # Parse Erlang binary format
                 # For now, let's create a simple test pattern since Erlang binary parsing is complex
-                pixels = []
-                for i in range(controller.led_count):
-                    # Create a simple moving pattern for testing
-                    r = (i + int(time.time() * 10)) % 256
-                    g = (i * 2) % 256
-                    b = (i * 3) % 256
-                    pixels.append((r, g, b))
+                # Create a simple moving pattern for testing
+                offset = int(time.time() * 10)
+                pixels = [
+                    ((i + offset) % 256, g, b)
+                    for i, (g, b) in enumerate(test_pattern_gb)
+                ]
 
                 controller.set_frame(pixels)
-                print(f"Processed frame: {len(pixels)} pixels (test pattern)")
+                logger.debug("Processed frame: %d pixels (test pattern)", len(pixels))
 
             except Exception as e:
-                print(f"Error processing frame: {e}")
+                logger.error("Error processing frame: %s", e)
 
     except KeyboardInterrupt:
         pass
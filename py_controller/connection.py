@@ -7,8 +7,51 @@ import threading
 import websocket
 import struct
 
+from frame import FRAME_HEADER
+
+# orjson is optional; it parses bytes directly and is much faster than json.
+# Its dumps() returns UTF-8 bytes, which ws.send() passes through unchanged.
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:
+    json_dumps = json.dumps
+    json_loads = json.loads
+
 logger = logging.getLogger("legrid-controller")
 
+# Batch header: <0x0B:1><FrameCount:4><Priority:1><Sequence:4><Timestamp:8>
+BATCH_HEADER = struct.Struct("<BIBIQ")
+# Each frame in a batch is prefixed with its length
+BATCH_FRAME_LENGTH = struct.Struct("<I")
+
+# Constant channel messages, serialized once
+PONG_MESSAGE = json_dumps(
+    {"topic": "controller:lobby", "event": "pong", "payload": {}, "ref": None}
+)
+LEAVE_MESSAGE = json_dumps(
+    {"topic": "controller:lobby", "event": "phx_leave", "payload": {}, "ref": None}
+)
+
+# Parameters that cause significant visual changes when modified
+SIGNIFICANT_PARAMS = (
+    "color_scheme",
+    "pattern_type",
+    "animation_mode",
+    "display_mode",
+    "invert",
+    "mirror",
+    "grid_style",
+)
+
+# Numerical parameters where a large relative change is significant
+NUMERICAL_PARAMS = (
+    "brightness",
+    "contrast",
+    "saturation",
+    "speed",
+    "intensity",
+)
+
 
 class ConnectionManager:
     """Manages WebSocket connection to the Phoenix server"""
@@ -22,7 +65,6 @@ class ConnectionManager:
         self.connected = False
         self.channel_joined = False
         self.reconnect_timer = None
-        self.heartbeat_timer = None
         self.reconnect_attempts = 0
         self.frame_queue = []  # Queue for frames to be processed
 
@@ -34,10 +76,16 @@ class ConnectionManager:
             self.enable_stats = getattr(config, "enable_stats", True)
             self.controller_id = getattr(config, "controller_id", str(uuid.uuid4()))
 
-        self.stats_timer = None
+        # Single background loop drives both heartbeat and stats reporting
+        self.periodic_thread = None
+        self.periodic_stop = threading.Event()
+        self.heartbeat_interval = 30.0
+        self.stats_interval = 5.0
 
-        # Added for _next_ref method
+        # Added for _next_ref method; refs are taken from both the websocket
+        # and periodic threads, so the increment is guarded
         self.ref_counter = 0
+        self.ref_lock = threading.Lock()
 
         # Stats and monitoring
         self.stats = {
@@ -49,14 +97,36 @@ class ConnectionManager:
             "fps": 0,
         }
 
-        self.frames_received = 0
-        self.frames_per_second = 0
-        self.last_fps_time = time.time()
+        self.last_fps_time = time.monotonic()
+        self.fps_window = 1.0
+        self.fps_window_frames = 0
         self.last_parameters = None
 
+        # Last controller_info sent on this connection, to skip resending it
+        self.last_controller_info = None
+
         # Last received data for potential reconnection recovery
         self.last_pattern_id = None
 
+        # Rate limit for batch error tracebacks
+        self.last_batch_traceback_time = 0.0
+
+        # Encoded all-black frame, built on first use once the grid size is set
+        self.black_frame = None
+
+        # Phoenix event name -> handler(payload, topic, ref)
+        self.event_handlers = {
+            "phx_reply": self._handle_reply,
+            "frame": self._handle_frame,
+            "request_stats": self._handle_request_stats,
+            "request_detailed_stats": self._handle_request_detailed_stats,
+            "simulation_config": self._handle_simulation_config,
+            "ping": self._handle_ping,
+            "display_batch": self._handle_display_batch,
+            "clear_display": self._handle_clear_display,
+            "parameter_change": self._handle_parameter_change,
+        }
+
     def connect(self):
         """Connect to the Phoenix WebSocket server"""
         logger.info(f"Connecting to server: {self.server_url}")
@@ -79,7 +149,7 @@ class ConnectionManager:
             websocket_thread.start()
 
             # Record connection attempt time
-            self.stats["connection_start_time"] = time.time()
+            self.stats["connection_start_time"] = time.monotonic()
 
             return True
         except Exception as e:
@@ -110,7 +180,7 @@ class ConnectionManager:
             return
 
         # Calculate uptime
-        uptime = time.time() - self.stats["connection_start_time"]
+        uptime = time.monotonic() - self.stats["connection_start_time"]
 
         # Create stats payload
         stats_payload = {
@@ -122,7 +192,7 @@ class ConnectionManager:
                     "frames_received"
                 ],  # Assuming all received frames are displayed
                 "connection_drops": self.stats["connection_drops"],
-                "fps": round(self.stats["fps"], 1),
+                "fps": round(self._current_fps(), 1),
                 "connection_uptime": uptime,
                 "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
             },
@@ -130,7 +200,7 @@ class ConnectionManager:
         }
 
         try:
-            self.ws.send(json.dumps(stats_payload))
+            self.ws.send(json_dumps(stats_payload))
             logger.debug("Sent controller stats")
         except Exception as e:
             logger.error(f"Error sending stats: {e}")
@@ -149,7 +219,7 @@ class ConnectionManager:
                 "frames_received": self.stats["frames_received"],
                 "frames_displayed": self.stats["frames_received"],
                 "connection_drops": self.stats["connection_drops"],
-                "fps": round(self.stats["fps"], 1),
+                "fps": round(self._current_fps(), 1),
                 "connection_uptime": self.stats["connection_uptime"],
                 "hardware_info": {
                     "type": "Raspberry Pi"
@@ -170,7 +240,7 @@ class ConnectionManager:
         }
 
         try:
-            self.ws.send(json.dumps(detailed_stats))
+            self.ws.send(json_dumps(detailed_stats))
             logger.info("Sent detailed stats")
         except Exception as e:
             logger.error(f"Error sending detailed stats: {e}")
@@ -183,7 +253,7 @@ class ConnectionManager:
 
         # Get current parameters to check if we need to resend
         current_params = self._get_controller_params()
-        if self.last_parameters == current_params:
+        if self.last_controller_info == current_params:
             logger.debug("Parameters unchanged, skipping controller_info")
             return
 
@@ -203,12 +273,12 @@ class ConnectionManager:
         }
 
         # Store parameters for comparison
-        self.last_parameters = current_params
+        self.last_controller_info = current_params
 
         try:
             # Send the info message
             logger.debug("Sending controller info")
-            self.ws.send(json.dumps(info_message))
+            self.ws.send(json_dumps(info_message))
         except Exception as e:
             logger.error(f"Error sending controller info: {e}")
 
@@ -216,15 +286,12 @@ class ConnectionManager:
         """Run the WebSocket connection in a thread"""
         try:
             # Print connection details for debugging
-            print(f"Starting WebSocket connection to {self.server_url}")
+            logger.info("Starting WebSocket connection to %s", self.server_url)
             # Set longer timeouts for better debugging
             self.ws.run_forever(ping_interval=20, ping_timeout=10, dispatcher=None)
-            print("WebSocket run_forever ended")
+            logger.info("WebSocket run_forever ended")
         except Exception as e:
-            logger.error(f"WebSocket thread error: {e}")
-            import traceback
-
-            traceback.print_exc()
+            logger.exception(f"WebSocket thread error: {e}")
             self._schedule_reconnect()
 
     def _on_open(self, ws):
@@ -233,14 +300,16 @@ class ConnectionManager:
         self.connected = True
         self.reconnect_attempts = 0
 
+        # Start a fresh FPS window so the idle gap before this connection
+        # is not averaged into the first reading
+        self.fps_window_frames = 0
+        self.last_fps_time = time.monotonic()
+
         # Join the Phoenix channel
         self._join_channel()
 
-        # Set up heartbeat
-        self._setup_heartbeat()
-
-        # Set up stats reporting
-        self._setup_stats_reporting()
+        # Set up heartbeat and stats reporting
+        self._start_periodic_tasks()
 
     def _on_message(self, ws, message):
         """Handle incoming WebSocket messages"""
@@ -251,20 +320,20 @@ class ConnectionManager:
                 if len(message) > 0 and message[0] == 0xB:
                     # This is a batch message (0xB is the batch identifier)
                     logger.debug(
-                        f"Received binary batch message ({len(message)} bytes)"
+                        "Received binary batch message (%d bytes)", len(message)
                     )
                     self._process_batch_data(message)
                 else:
                     # This is a single frame, process directly
                     logger.debug(
-                        f"Received binary frame message ({len(message)} bytes)"
+                        "Received binary frame message (%d bytes)", len(message)
                     )
                     self.on_frame_callback(message)
                     self._update_frame_stats()
                 return
 
             # Handle text (JSON) messages
-            data = json.loads(message)
+            data = json_loads(message)
 
             # Extract Phoenix message components
             event = data.get("event")
@@ -272,181 +341,154 @@ class ConnectionManager:
             ref = data.get("ref")
             payload = data.get("payload", {})
 
-            logger.debug(f"Received event: {event}, topic: {topic}")
-
-            # Check for successful channel join
-            if event == "phx_reply" and topic == "controller:lobby":
-                if payload.get("status") == "ok":
-                    # This is a successful reply to one of our requests
-                    logger.debug(f"Received successful reply with ref: {ref}")
-
-                    # Check if this is a response to our join request
-                    if not self.channel_joined:
-                        logger.info("Successfully joined controller channel!")
-                        self.channel_joined = True
-
-                        # Send controller info
-                        self.send_controller_info()
-
-                        # Request initial batch of frames
-                        logger.info("Requesting initial batch of frames")
-                        if self._request_batch(0):
-                            logger.info("Initial batch request sent")
-                        else:
-                            logger.error("Failed to request initial batch")
-
-                    # Also handle batch request confirmations
-                    response = payload.get("response", {})
-                    if response.get("status") == "request_received":
-                        logger.debug(f"Server confirmed batch request: {response}")
-
-            # Handle other Phoenix message types
-            elif event == "frame":
-                # Handle frame message
-                if "binary" in payload:
-                    # The binary data is base64 encoded in JSON
-                    binary_data = base64.b64decode(payload["binary"])
-
-                    # Track pattern/parameters
-                    if "pattern_id" in payload:
-                        self.last_pattern_id = payload["pattern_id"]
-                    if "parameters" in payload:
-                        self.last_parameters = payload["parameters"]
-
-                    # Process frame
-                    self.on_frame_callback(binary_data)
-                    self._update_frame_stats()
+            logger.debug("Received event: %s, topic: %s", event, topic)
 
-            elif event == "request_stats":
-                # Send stats in response to request
-                self.send_stats()
-
-            elif event == "request_detailed_stats":
-                # Send detailed stats
-                self.send_detailed_stats()
-
-            elif event == "simulation_config":
-                # Apply simulation config
-                logger.info(f"Received simulation config: {payload}")
-                # This would be handled by the main controller
-
-            elif event == "ping":
-                # Respond to ping
-                self.ws.send(
-                    json.dumps(
-                        {
-                            "topic": "controller:lobby",
-                            "event": "pong",
-                            "payload": {},
-                            "ref": None,
-                        }
-                    )
-                )
+            # Dispatch to the handler registered for this event
+            handler = self.event_handlers.get(event)
+            if handler:
+                handler(payload, topic, ref)
 
-            elif event == "display_batch":
-                # Process batch of frames
-                logger.debug(
-                    f"Received display_batch event with {len(str(payload))} bytes of data"
-                )
-                try:
-                    seq = payload.get("sequence", 0)
-                    pattern = payload.get("pattern", "unknown")
-                    priority = payload.get("priority", 0)
-
-                    # Check if we have binary data in the payload
-                    if "binary" in payload:
-                        # The binary data is base64 encoded in JSON
-                        binary_data = base64.b64decode(payload["binary"])
-                        logger.info(
-                            f"Processing batch: {len(binary_data)} bytes, seq={seq}, pattern={pattern}"
-                        )
-                        self._process_batch_data(binary_data)
-                    else:
-                        # Log message format issue
-                        logger.warning(
-                            "No binary field found in payload, checking message format"
-                        )
-                        logger.warning(
-                            "JSON frame format not supported, server should use binary"
-                        )
-
-                        # Try to be graceful - request next batch with incremented sequence
-                        self._request_batch(seq + 1)
-                except Exception as e:
-                    logger.error(f"Error processing display_batch event: {e}")
-                    # Just try to keep going with sequential batch
-                    self._request_batch(seq + 1 if "seq" in locals() else 0)
+        except Exception as e:
+            logger.error(f"Error processing message: {e}")
+            if isinstance(message, bytes):
+                logger.debug(f"Binary message first bytes: {message[:10].hex()}")
 
-            elif event == "clear_display":
-                # Handle clear display command during pattern transitions
-                logger.info("Received clear display command - clearing frame queue")
-                try:
-                    # Clear our frame queue
-                    self.frame_queue.clear()
-                    # Call the frame callback with an all-black frame to reset display
-                    width, height = (
-                        getattr(self, "width", 25),
-                        getattr(self, "height", 24),
-                    )
-                    black_pixels = [(0, 0, 0) for _ in range(width * height)]
-                    from frame import Frame
+    def _handle_reply(self, payload, topic, ref):
+        """Handle a phx_reply, including the channel join confirmation"""
+        if topic != "controller:lobby" or payload.get("status") != "ok":
+            return
 
-                    black_frame = Frame(width=width, height=height, pixels=black_pixels)
-                    self.on_frame_callback(black_frame.pixels)
-                    logger.info("Display cleared to black for pattern transition")
-                except Exception as e:
-                    logger.error(f"Error handling clear_display: {e}")
+        # This is a successful reply to one of our requests
+        logger.debug("Received successful reply with ref: %s", ref)
 
-            elif event == "parameter_change":
-                # Handle parameter change command during config updates
-                logger.info("Received parameter change command")
-                try:
-                    # Get the new parameters
-                    new_params = payload if isinstance(payload, dict) else {}
+        # Check if this is a response to our join request
+        if not self.channel_joined:
+            logger.info("Successfully joined controller channel!")
+            self.channel_joined = True
 
-                    # Skip if parameters haven't actually changed
-                    if self.last_parameters == new_params:
-                        logger.debug("Parameters unchanged, ignoring")
-                        return
+            # Send controller info
+            self.send_controller_info()
 
-                    # Check if any significant parameters changed
-                    significant_change = self._is_significant_parameter_change(
-                        self.last_parameters, new_params
-                    )
+            # Request initial batch of frames
+            logger.info("Requesting initial batch of frames")
+            if self._request_batch(0):
+                logger.info("Initial batch request sent")
+            else:
+                logger.error("Failed to request initial batch")
+
+        # Also handle batch request confirmations
+        response = payload.get("response", {})
+        if response.get("status") == "request_received":
+            logger.debug("Server confirmed batch request: %s", response)
+
+    def _handle_frame(self, payload, topic, ref):
+        """Handle a single base64-encoded frame event"""
+        if "binary" in payload:
+            # The binary data is base64 encoded in JSON
+            binary_data = base64.b64decode(payload["binary"])
+
+            # Track pattern/parameters
+            if "pattern_id" in payload:
+                self.last_pattern_id = payload["pattern_id"]
+            if "parameters" in payload:
+                self.last_parameters = payload["parameters"]
+
+            # Process frame
+            self.on_frame_callback(binary_data)
+            self._update_frame_stats()
+
+    def _handle_request_stats(self, payload, topic, ref):
+        """Send stats in response to request"""
+        self.send_stats()
+
+    def _handle_request_detailed_stats(self, payload, topic, ref):
+        """Send detailed stats in response to request"""
+        self.send_detailed_stats()
+
+    def _handle_simulation_config(self, payload, topic, ref):
+        """Log a simulation config update"""
+        logger.info(f"Received simulation config: {payload}")
+        # This would be handled by the main controller
+
+    def _handle_ping(self, payload, topic, ref):
+        """Respond to a ping"""
+        self.ws.send(PONG_MESSAGE)
+
+    def _handle_display_batch(self, payload, topic, ref):
+        """Process a base64-encoded batch of frames"""
+        logger.debug("Received display_batch event")
+        seq = None
+        try:
+            seq = payload.get("sequence", 0)
+            pattern = payload.get("pattern", "unknown")
+
+            # Check if we have binary data in the payload
+            if "binary" in payload:
+                # The binary data is base64 encoded in JSON
+                binary_data = base64.b64decode(payload["binary"])
+                logger.info(
+                    "Processing batch: %d bytes, seq=%s, pattern=%s",
+                    len(binary_data),
+                    seq,
+                    pattern,
+                )
+                self._process_batch_data(binary_data)
+            else:
+                # Log message format issue
+                logger.warning(
+                    "No binary field found in payload, checking message format"
+                )
+                logger.warning(
+                    "JSON frame format not supported, server should use binary"
+                )
 
-                    if significant_change:
-                        logger.info(
-                            "Significant parameter change detected, clearing frame queue"
-                        )
-                        # Clear our frame queue
-                        self.frame_queue.clear()
-                        # Call the frame callback with an all-black frame to reset display
-                        width, height = (
-                            getattr(self, "width", 25),
-                            getattr(self, "height", 24),
-                        )
-                        black_pixels = [(0, 0, 0) for _ in range(width * height)]
-                        from frame import Frame
-
-                        black_frame = Frame(
-                            width=width, height=height, pixels=black_pixels
-                        )
-                        self.on_frame_callback(black_frame.pixels)
-                        logger.info("Display cleared to black for parameter transition")
-                    else:
-                        logger.info(
-                            "Minor parameter change, allowing smooth transition"
-                        )
-
-                    # Update our stored parameters
-                    self.last_parameters = new_params
-                except Exception as e:
-                    logger.error(f"Error handling parameter_change: {e}")
+                # Try to be graceful - request next batch with incremented sequence
+                self._request_batch(seq + 1)
+        except Exception as e:
+            logger.error(f"Error processing display_batch event: {e}")
+            # Keep going with the next batch, or the initial batch if the
+            # payload was too malformed to carry a sequence
+            self._request_batch(seq + 1 if seq is not None else 0)
+
+    def _handle_clear_display(self, payload, topic, ref):
+        """Handle clear display command during pattern transitions"""
+        logger.info("Received clear display command - clearing frame queue")
+        try:
+            self._clear_display()
+            logger.info("Display cleared to black for pattern transition")
+        except Exception as e:
+            logger.error(f"Error handling clear_display: {e}")
+
+    def _handle_parameter_change(self, payload, topic, ref):
+        """Handle parameter change command during config updates"""
+        logger.info("Received parameter change command")
+        try:
+            # Get the new parameters
+            new_params = payload if isinstance(payload, dict) else {}
+
+            # Skip if parameters haven't actually changed
+            if self.last_parameters == new_params:
+                logger.debug("Parameters unchanged, ignoring")
+                return
+
+            # Check if any significant parameters changed
+            significant_change = self._is_significant_parameter_change(
+                self.last_parameters, new_params
+            )
+
+            if significant_change:
+                logger.info(
+                    "Significant parameter change detected, clearing frame queue"
+                )
+                self._clear_display()
+                logger.info("Display cleared to black for parameter transition")
+            else:
+                logger.info("Minor parameter change, allowing smooth transition")
 
+            # Update our stored parameters
+            self.last_parameters = new_params
         except Exception as e:
-            logger.error(f"Error processing message: {e}")
-            if isinstance(message, bytes):
-                logger.debug(f"Binary message first bytes: {message[:10].hex()}")
+            logger.error(f"Error handling parameter_change: {e}")
 
     def _on_error(self, ws, error):
         """Handle WebSocket errors"""
@@ -460,13 +502,16 @@ class ConnectionManager:
         # Update connection statistics
         if self.stats["connection_start_time"] > 0:
             self.stats["connection_uptime"] += (
-                time.time() - self.stats["connection_start_time"]
+                time.monotonic() - self.stats["connection_start_time"]
             )
 
         self.stats["connection_drops"] += 1
         self.connected = False
         self.channel_joined = False
 
+        # The next connection is a new channel, so announce ourselves again
+        self.last_controller_info = None
+
         # Cancel timers
         self._cancel_timers()
 
@@ -497,89 +542,105 @@ class ConnectionManager:
 
         # Send join request
         logger.info("Sent join message")
-        self.ws.send(json.dumps(join_message))
+        self.ws.send(json_dumps(join_message))
 
         # Note that we'll set channel_joined=True when we receive the join confirmation
 
     def _send_leave_message(self):
         """Send Phoenix channel leave message"""
-        leave_message = {
-            "topic": "controller:lobby",
-            "event": "phx_leave",
-            "payload": {},
-            "ref": None,
-        }
-
         try:
-            self.ws.send(json.dumps(leave_message))
+            self.ws.send(LEAVE_MESSAGE)
             logger.info("Sent leave message")
         except Exception as e:
             logger.error(f"Error sending leave message: {e}")
 
-    def _setup_heartbeat(self):
-        """Set up Phoenix heartbeat"""
-
-        def send_heartbeat():
-            if self.connected:
-                try:
-                    heartbeat_message = {
-                        "topic": "phoenix",
-                        "event": "heartbeat",
-                        "payload": {},
-                        "ref": str(int(time.time())),
-                    }
-                    self.ws.send(json.dumps(heartbeat_message))
-                    logger.debug("Sent Phoenix heartbeat")
-                except Exception as e:
-                    logger.error(f"Error sending heartbeat: {e}")
-
-                # Schedule next heartbeat
-                self.heartbeat_timer = threading.Timer(30.0, send_heartbeat)
-                self.heartbeat_timer.daemon = True
-                self.heartbeat_timer.start()
+    def _send_heartbeat(self):
+        """Send a Phoenix heartbeat"""
+        try:
+            heartbeat_message = {
+                "topic": "phoenix",
+                "event": "heartbeat",
+                "payload": {},
+                "ref": str(self._next_ref()),
+            }
+            self.ws.send(json_dumps(heartbeat_message))
+            logger.debug("Sent Phoenix heartbeat")
+        except Exception as e:
+            logger.error(f"Error sending heartbeat: {e}")
 
-        # Start heartbeat timer
-        self.heartbeat_timer = threading.Timer(30.0, send_heartbeat)
-        self.heartbeat_timer.daemon = True
-        self.heartbeat_timer.start()
+    def _start_periodic_tasks(self):
+        """Start the background loop for heartbeat and stats reporting
 
-    def _setup_stats_reporting(self):
-        """Set up periodic stats reporting"""
+        Both tasks share one thread instead of re-spawning a timer thread
+        for every tick.
+        """
+        self._stop_periodic_tasks()
 
-        def send_stats_periodically():
-            if self.connected:
+        self.periodic_stop = threading.Event()
+        self.periodic_thread = threading.Thread(
+            target=self._periodic_loop, args=(self.periodic_stop,)
+        )
+        self.periodic_thread.daemon = True
+        self.periodic_thread.start()
+
+    def _stop_periodic_tasks(self):
+        """Signal the periodic loop to exit"""
+        self.periodic_stop.set()
+        self.periodic_thread = None
+
+    def _periodic_loop(self, stop_event):
+        """Send heartbeats and stats on their intervals until stopped"""
+        next_heartbeat = time.monotonic() + self.heartbeat_interval
+        next_stats = time.monotonic() + self.stats_interval
+
+        while not stop_event.wait(
+            max(0.0, min(next_heartbeat, next_stats) - time.monotonic())
+        ):
+            if not self.connected:
+                break
+
+            now = time.monotonic()
+
+            # Reschedule from the current time rather than the missed
+            # deadline, so a stalled send does not release a burst of ticks
+            if now >= next_heartbeat:
+                self._send_heartbeat()
+                next_heartbeat = time.monotonic() + self.heartbeat_interval
+
+            if now >= next_stats:
                 try:
                     self.send_stats()
                 except Exception as e:
                     logger.error(f"Error in stats reporting: {e}")
+                next_stats = time.monotonic() + self.stats_interval
 
-                # Schedule next report
-                self.stats_timer = threading.Timer(5.0, send_stats_periodically)
-                self.stats_timer.daemon = True
-                self.stats_timer.start()
-
-        # Start stats timer
-        self.stats_timer = threading.Timer(5.0, send_stats_periodically)
-        self.stats_timer.daemon = True
-        self.stats_timer.start()
-
-    def _update_frame_stats(self):
-        """Update frame-related statistics"""
-        current_time = time.time()
-        self.stats["frames_received"] += 1
-        self.frames_received += 1
-
-        # Calculate FPS
-        if self.stats["last_frame_time"] > 0:
-            time_diff = current_time - self.stats["last_frame_time"]
-            if time_diff > 0:
-                # Apply smoothing to FPS calculation
-                new_fps = 1.0 / time_diff
-                self.stats["fps"] = 0.8 * self.stats["fps"] + 0.2 * new_fps
-                self.frames_per_second = self.stats["fps"]
+    def _update_frame_stats(self, frame_count=1):
+        """Update frame-related statistics
+
+        Batches are accounted for in one call so the clock is read once per
+        batch rather than once per frame.
+        """
+        current_time = time.monotonic()
+        self.stats["frames_received"] += frame_count
 
         self.stats["last_frame_time"] = current_time
 
+        # Accumulate frames and only recompute FPS once per window
+        self.fps_window_frames += frame_count
+        elapsed = current_time - self.last_fps_time
+        if elapsed < self.fps_window:
+            return
+
+        self.stats["fps"] = self.fps_window_frames / elapsed
+        self.fps_window_frames = 0
+        self.last_fps_time = current_time
+
+    def _current_fps(self):
+        """Return the last FPS reading, or 0 once frames have stopped arriving"""
+        if time.monotonic() - self.stats["last_frame_time"] > self.fps_window:
+            return 0
+        return self.stats["fps"]
+
     def _schedule_reconnect(self):
         """Schedule a reconnection attempt"""
         # Cancel any existing reconnect timer
@@ -631,9 +692,9 @@ class ConnectionManager:
             }
 
             # Send request
-            message_json = json.dumps(request_message)
+            message_json = json_dumps(request_message)
             self.ws.send(message_json)
-            logger.debug(f"Sent batch request: seq={sequence}, space={space}")
+            logger.debug("Sent batch request: seq=%d, space=%d", sequence, space)
             return True
         except Exception as e:
             logger.error(f"Error sending batch request: {e}")
@@ -645,14 +706,7 @@ class ConnectionManager:
             self.reconnect_timer.cancel()
             self.reconnect_timer = None
 
-        if self.heartbeat_timer:
-            self.heartbeat_timer.cancel()
-            self.heartbeat_timer = None
-
-        # Fix: Initialize stats_timer in __init__ and check if it exists
-        if hasattr(self, "stats_timer") and self.stats_timer:
-            self.stats_timer.cancel()
-            self.stats_timer = None
+        self._stop_periodic_tasks()
 
     def _send_batch_ack(self, sequence, frame_count):
         """Send an acknowledgment to the server after processing a batch"""
@@ -674,9 +728,9 @@ class ConnectionManager:
             }
 
             # Send the acknowledgment
-            self.ws.send(json.dumps(ack_message))
+            self.ws.send(json_dumps(ack_message))
             logger.debug(
-                f"Sent batch_ack for sequence {sequence}, frames: {frame_count}"
+                "Sent batch_ack for sequence %d, frames: %d", sequence, frame_count
             )
             return True
         except Exception as e:
@@ -685,7 +739,7 @@ class ConnectionManager:
 
     def _process_batch_data(self, binary_data):
         """Process a batch of frames from binary data"""
-        if len(binary_data) < 18:  # Minimum header size
+        if len(binary_data) < BATCH_HEADER.size:  # Minimum header size
             logger.error(f"Batch too small: {len(binary_data)} bytes")
             return
 
@@ -693,37 +747,46 @@ class ConnectionManager:
         # The channel_joined flag might have been updated by incoming messages during processing
 
         try:
-            # Parse batch header
-            batch_id = binary_data[0]
+            # Parse batch header in one call
+            (
+                batch_id,
+                frame_count,
+                priority_flag,
+                sequence,
+                timestamp,
+            ) = BATCH_HEADER.unpack_from(binary_data)
+
             if batch_id != 0xB:  # Verify this is a batch (0xB = 11)
                 logger.error(f"Invalid batch identifier: {batch_id:02x}, expected 0x0B")
                 return
 
-            # Extract header fields
-            frame_count = struct.unpack("<I", binary_data[1:5])[0]
-            priority_flag = binary_data[5]
-            sequence = struct.unpack("<I", binary_data[6:10])[0]
-            timestamp = struct.unpack("<Q", binary_data[10:18])[0]
-
             logger.info(
-                f"Batch header: frames={frame_count}, priority={priority_flag}, seq={sequence}, timestamp={timestamp}"
+                "Batch header: frames=%d, priority=%d, seq=%d, timestamp=%d",
+                frame_count,
+                priority_flag,
+                sequence,
+                timestamp,
             )
 
+            # Slice frames out of a memoryview so each frame is handed to the
+            # callback without copying it out of the batch buffer
+            batch_view = memoryview(binary_data)
+
             # Process each frame in the batch
-            offset = 18  # Start after header
+            offset = BATCH_HEADER.size  # Start after header
             frames_processed = 0
 
             while offset < len(binary_data) and frames_processed < frame_count:
                 # Check if we have enough data for frame length
-                if offset + 4 > len(binary_data):
+                if offset + BATCH_FRAME_LENGTH.size > len(binary_data):
                     logger.warning(
                         f"Incomplete batch: missing frame length at offset {offset}"
                     )
                     break
 
                 # Get frame length
-                frame_length = struct.unpack("<I", binary_data[offset : offset + 4])[0]
-                offset += 4
+                frame_length = BATCH_FRAME_LENGTH.unpack_from(binary_data, offset)[0]
+                offset += BATCH_FRAME_LENGTH.size
 
                 # Check if we have enough data for the frame
                 if offset + frame_length > len(binary_data):
@@ -733,23 +796,38 @@ class ConnectionManager:
                     break
 
                 # Extract this frame's data
-                frame_data = binary_data[offset : offset + frame_length]
+                frame_data = batch_view[offset : offset + frame_length]
 
                 # Process this frame
                 logger.debug(
-                    f"Processing frame {frames_processed + 1}/{frame_count} ({frame_length} bytes)"
+                    "Processing frame %d/%d (%d bytes)",
+                    frames_processed + 1,
+                    frame_count,
+                    frame_length,
                 )
-                self.on_frame_callback(frame_data)
+                try:
+                    self.on_frame_callback(frame_data)
+                except Exception:
+                    # LegridController._process_frame handles its own errors,
+                    # but a callback that raises must not lose the frames
+                    # already shown from this batch
+                    if frames_processed:
+                        self._update_frame_stats(frames_processed)
+                    raise
 
                 # Move to next frame
                 offset += frame_length
                 frames_processed += 1
 
-                # Update statistics
-                self._update_frame_stats()
+            # Update statistics for the whole batch
+            if frames_processed:
+                self._update_frame_stats(frames_processed)
 
             logger.info(
-                f"Processed {frames_processed}/{frame_count} frames from batch, next batch seq={sequence + 1}"
+                "Processed %d/%d frames from batch, next batch seq=%d",
+                frames_processed,
+                frame_count,
+                sequence + 1,
             )
 
             # Send batch acknowledgment - check current connection state
@@ -757,9 +835,9 @@ class ConnectionManager:
                 self._send_batch_ack(sequence, frames_processed)
 
                 # Request next batch
-                logger.debug(f"Requesting next batch after seq={sequence}")
+                logger.debug("Requesting next batch after seq=%d", sequence)
                 if self._request_batch(sequence + 1):
-                    logger.debug(f"Next batch request sent: seq={sequence + 1}")
+                    logger.debug("Next batch request sent: seq=%d", sequence + 1)
                 else:
                     logger.error(f"Failed to request next batch (seq={sequence + 1})")
             else:
@@ -774,10 +852,14 @@ class ConnectionManager:
                     self._request_batch(sequence + 1)
 
         except Exception as e:
-            logger.error(f"Error processing batch: {e}")
-            import traceback
-
-            logger.error(traceback.format_exc())
+            # Formatting a traceback is costly; include one at most once per
+            # second so a stream of bad batches cannot stall the receive thread
+            now = time.monotonic()
+            if now - self.last_batch_traceback_time >= 1.0:
+                self.last_batch_traceback_time = now
+                logger.exception(f"Error processing batch: {e}")
+            else:
+                logger.error(f"Error processing batch: {e}")
             if len(binary_data) > 30:
                 logger.debug(f"First 30 bytes of batch: {binary_data[:30].hex()}")
 
@@ -786,8 +868,8 @@ class ConnectionManager:
                 try:
                     # Extract sequence if possible, or use 0
                     seq = 0
-                    if len(binary_data) >= 10:
-                        seq = struct.unpack("<I", binary_data[6:10])[0]
+                    if len(binary_data) >= BATCH_HEADER.size:
+                        seq = BATCH_HEADER.unpack_from(binary_data)[3]
                     logger.info(
                         f"Attempting to request next batch after error (seq={seq + 1})"
                     )
@@ -795,10 +877,25 @@ class ConnectionManager:
                 except Exception as e2:
                     logger.error(f"Failed to request next batch after error: {e2}")
 
+    def _clear_display(self):
+        """Drop queued frames and push an all-black frame to the display"""
+        self.frame_queue.clear()
+
+        width = getattr(self, "width", 25)
+        height = getattr(self, "height", 24)
+
+        if self.black_frame is None or self.black_frame[:2] != (width, height):
+            # Same binary layout the server sends
+            header = FRAME_HEADER.pack(1, 1, 0, width, height)
+            self.black_frame = (width, height, header + bytes(width * height * 3))
+
+        self.on_frame_callback(self.black_frame[2])
+
     def _next_ref(self):
         """Generate a new reference ID for Phoenix messages"""
-        self.ref_counter += 1
-        return self.ref_counter
+        with self.ref_lock:
+            self.ref_counter += 1
+            return self.ref_counter
 
     def _get_controller_params(self):
         """Get controller parameters for info message"""
@@ -828,19 +925,8 @@ class ConnectionManager:
             # If either is None/empty, it's a significant change
             return True
 
-        # Define parameters that cause significant visual changes when modified
-        significant_params = [
-            "color_scheme",
-            "pattern_type",
-            "animation_mode",
-            "display_mode",
-            "invert",
-            "mirror",
-            "grid_style",
-        ]
-
         # Check if any significant parameter was changed
-        for param in significant_params:
+        for param in SIGNIFICANT_PARAMS:
             if param in old_params and param in new_params:
                 if old_params[param] != new_params[param]:
                     logger.info(
@@ -849,14 +935,7 @@ class ConnectionManager:
                     return True
 
         # Check for major numerical parameter changes (greater than 50% change)
-        numerical_params = [
-            "brightness",
-            "contrast",
-            "saturation",
-            "speed",
-            "intensity",
-        ]
-        for param in numerical_params:
+        for param in NUMERICAL_PARAMS:
             if param in old_params and param in new_params:
                 old_val = (
                     float(old_params[param])
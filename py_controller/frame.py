@@ -5,6 +5,9 @@ from typing import List, Tuple, Optional, Dict, Any
 
 logger = logging.getLogger("legrid-controller")
 
+# <Version:1><Type:1><FrameID:4><Width:2><Height:2>, little-endian
+FRAME_HEADER = struct.Struct("<BBIHH")
+
 
 @dataclass
 class Frame:
@@ -41,6 +44,13 @@ class FrameProcessor:
         self.flip_y = flip_y
         self.transpose = transpose
 
+        # (source index, physical index) table cached together with the
+        # frame size it was built for, as (frame_width, frame_height, pairs)
+        self._layout_map = self._build_layout_map(width, height)
+
+        # Output buffer reused by map_led_layout for every frame
+        self._physical_pixels = [(0, 0, 0)] * (width * height)
+
         # Statistics
         self.frames_processed = 0
         self.last_frame_id = None
@@ -49,32 +59,32 @@ class FrameProcessor:
     def process_binary_frame(self, binary_data):
         """Process a binary frame and return a Frame object
 
+        Accepts any buffer (bytes, bytearray or memoryview).
+
         Binary format:
         <Version:1><Type:1><FrameID:4><Width:2><Height:2><Pixels...>
         """
         try:
             # Ensure we have at least the header
-            if len(binary_data) < 10:
+            if len(binary_data) < FRAME_HEADER.size:
                 logger.warning(
                     f"Invalid frame: insufficient data ({len(binary_data)} bytes)"
                 )
                 return None
 
-            # Parse header
-            version = binary_data[0]
-            msg_type = binary_data[1]
-            frame_id_bytes = binary_data[2:6]
-            width_bytes = binary_data[6:8]
-            height_bytes = binary_data[8:10]
-
-            # Parse values with appropriate endianness (little-endian)
-            frame_id = struct.unpack("<I", frame_id_bytes)[0]
-            width = struct.unpack("<H", width_bytes)[0]
-            height = struct.unpack("<H", height_bytes)[0]
+            # Parse the whole header in one call
+            version, msg_type, frame_id, width, height = FRAME_HEADER.unpack_from(
+                binary_data
+            )
 
             # Log raw header values to debug
             logger.debug(
-                f"Frame header: version={version}, type={msg_type}, id={frame_id}, dimensions={width}x{height}"
+                "Frame header: version=%d, type=%d, id=%d, dimensions=%dx%d",
+                version,
+                msg_type,
+                frame_id,
+                width,
+                height,
             )
 
             # Validate dimensions
@@ -93,7 +103,7 @@ class FrameProcessor:
                 return None
 
             # Check if we have enough pixel data
-            pixel_data = binary_data[10:]
+            pixel_data = memoryview(binary_data)[FRAME_HEADER.size :]
             expected_data_length = width * height * 3
             if len(pixel_data) < expected_data_length:
                 logger.warning(
@@ -101,18 +111,15 @@ class FrameProcessor:
                 )
                 # Continue anyway - we'll use what we have
 
-            # Decode pixels
-            pixels = []
-            for i in range(min(width * height, len(pixel_data) // 3)):
-                idx = i * 3
-                r = pixel_data[idx]
-                g = pixel_data[idx + 1]
-                b = pixel_data[idx + 2]
-                pixels.append((r, g, b))
+            # Decode pixels by zipping the strided channel slices in one pass;
+            # bytes are already 0-255 so no per-value range check is needed
+            pixel_count = min(width * height, len(pixel_data) // 3)
+            pixel_data = pixel_data[: pixel_count * 3]
+            pixels = list(zip(pixel_data[0::3], pixel_data[1::3], pixel_data[2::3]))
 
             # Pad with black if needed
-            while len(pixels) < width * height:
-                pixels.append((0, 0, 0))
+            if pixel_count < width * height:
+                pixels.extend([(0, 0, 0)] * (width * height - pixel_count))
 
             # Create frame object
             frame = Frame(width=width, height=height, pixels=pixels)
@@ -131,30 +138,47 @@ class FrameProcessor:
             return None
 
     def map_led_layout(self, frame):
-        """Map logical pixel positions to physical LED indices based on configuration"""
+        """Map logical pixel positions to physical LED indices based on configuration
+
+        The returned list is reused for the next frame, so callers must
+        consume it before mapping another frame.
+        """
         if not frame or not frame.pixels:
             return []
 
-        # Create a copy of the pixel array for physical layout
-        physical_pixels = [(0, 0, 0)] * (self.width * self.height)
-
-        # Apply layout mapping
-        for y in range(min(frame.height, self.height)):
-            for x in range(min(frame.width, self.width)):
-                # Source index in logical frame
-                src_idx = y * frame.width + x
+        # Rebuild the index table only when the incoming frame size changes
+        layout_map = self._layout_map
+        physical_pixels = self._physical_pixels
+        if layout_map[0] != frame.width or layout_map[1] != frame.height:
+            layout_map = self._build_layout_map(frame.width, frame.height)
+            self._layout_map = layout_map
+            # Positions outside the new frame size must go back to black
+            physical_pixels[:] = [(0, 0, 0)] * len(physical_pixels)
 
-                # Only process if we have data for this pixel
-                if src_idx < len(frame.pixels):
-                    # Calculate physical position
-                    physical_idx = self.map_pixel_to_index(x, y)
+        # Pad short frames once so every table entry has a source pixel
+        pixels = frame.pixels
+        missing = frame.width * frame.height - len(pixels)
+        if missing > 0:
+            pixels = pixels + [(0, 0, 0)] * missing
 
-                    # Set physical pixel if within bounds
-                    if 0 <= physical_idx < len(physical_pixels):
-                        physical_pixels[physical_idx] = frame.pixels[src_idx]
+        for src_idx, physical_idx in layout_map[2]:
+            physical_pixels[physical_idx] = pixels[src_idx]
 
         return physical_pixels
 
+    def _build_layout_map(self, frame_width, frame_height):
+        """Precompute (source index, physical index) pairs for a frame size"""
+        pixel_count = self.width * self.height
+        pairs = []
+
+        for y in range(min(frame_height, self.height)):
+            for x in range(min(frame_width, self.width)):
+                physical_idx = self.map_pixel_to_index(x, y)
+                if 0 <= physical_idx < pixel_count:
+                    pairs.append((y * frame_width + x, physical_idx))
+
+        return (frame_width, frame_height, tuple(pairs))
+
     def map_pixel_to_index(self, x, y):
         """Map an x,y position to a physical LED index based on the configuration"""
         width, height = self.width, self.height
@@ -22,6 +22,11 @@ class LEDHardware:
         """Set a single pixel"""
         raise NotImplementedError
 
+    def set_pixels(self, pixels):
+        """Set consecutive pixels from index 0 from a list of (r, g, b) tuples"""
+        for i, (r, g, b) in enumerate(pixels[: self.led_count]):
+            self.set_pixel(i, r, g, b)
+
     def show(self):
         """Update the display"""
         raise NotImplementedError
@@ -82,6 +87,14 @@ class NeoPixelHardware(LEDHardware):
         if 0 <= index < self.led_count:
             self.strip[index] = (r, g, b)
 
+    def set_pixels(self, pixels):
+        """Set consecutive pixels with a single slice assignment"""
+        if not self.initialized or not self.strip:
+            return
+
+        pixels = pixels[: self.led_count]
+        self.strip[0 : len(pixels)] = pixels
+
     def show(self):
         """Update the physical display"""
         if self.initialized and self.strip:
@@ -92,8 +105,7 @@ class NeoPixelHardware(LEDHardware):
         if not self.initialized or not self.strip:
             return
 
-        for i in range(self.led_count):
-            self.strip[i] = (0, 0, 0)
+        self.strip.fill((0, 0, 0))
         self.strip.show()
 
     def cleanup(self):
@@ -119,15 +131,22 @@ class MockHardware(LEDHardware):
         if 0 <= index < self.led_count:
             self.pixels[index] = (r, g, b)
 
+    def set_pixels(self, pixels):
+        """Set consecutive pixels in the mock display"""
+        pixels = pixels[: self.led_count]
+        self.pixels[0 : len(pixels)] = pixels
+
     def show(self):
         """Update the mock display"""
-        # For visual debugging in console output
-        lit_count = sum(1 for p in self.pixels if p != (0, 0, 0))
-        logger.debug(f"Display updated: {lit_count}/{self.led_count} pixels lit")
+        # For visual debugging in console output; counting lit pixels walks
+        # the whole strip, so only do it when debug output is enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            lit_count = sum(1 for p in self.pixels if p != (0, 0, 0))
+            logger.debug("Display updated: %d/%d pixels lit", lit_count, self.led_count)
 
     def clear(self):
         """Clear all pixels"""
-        self.pixels = [(0, 0, 0) for _ in range(self.led_count)]
+        self.pixels = [(0, 0, 0)] * self.led_count
         logger.debug("Display cleared")
 
 
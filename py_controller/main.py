@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 import os
 import sys
-import time
 import signal
+import threading
 import logging
 import argparse
 from typing import Dict
@@ -45,12 +45,13 @@ class LegridController:
         self.logger.info(f"Server URL: {self.server_url}")
 
         # Initialize components
-        self.running = True
+        self.shutdown_event = threading.Event()
         self.hardware = None
         self.frame_processor = None
         self.connection = None
         self.last_pattern_id = None
         self.last_parameters_version = None
+        self.last_displayed_pixels = None
 
         # Set up signal handling for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -109,10 +110,9 @@ class LegridController:
         # Main loop
         try:
             self.logger.info("Controller running. Press Ctrl+C to exit.")
-            while self.running:
-                # Main thread just keeps the program alive
-                # Actual work is done in callback methods and other threads
-                time.sleep(0.1)
+            # Main thread just keeps the program alive until a shutdown signal
+            # Actual work is done in callback methods and other threads
+            self.shutdown_event.wait()
 
         except KeyboardInterrupt:
             self.logger.info("Keyboard interrupt received")
@@ -150,25 +150,27 @@ class LegridController:
                 and frame.pattern_id != self.last_pattern_id
             ):
                 self.logger.warning(
-                    f"Dropping frame from old pattern {frame.pattern_id} (current: {self.last_pattern_id})"
+                    "Dropping frame from old pattern %s (current: %s)",
+                    frame.pattern_id,
+                    self.last_pattern_id,
                 )
                 return
 
             # Update last pattern ID if different
             if frame.pattern_id and frame.pattern_id != self.last_pattern_id:
-                self.logger.info(f"Pattern changed to {frame.pattern_id}")
+                self.logger.info("Pattern changed to %s", frame.pattern_id)
                 self.last_pattern_id = frame.pattern_id
 
             # Check if parameters are available and if we have a parameters version
-            if (
-                hasattr(frame, "parameters")
-                and frame.parameters
-                and hasattr(self, "last_parameters_version")
-            ):
+            # (last_parameters_version starts as None until one is known)
+            if frame.parameters and self.last_parameters_version is not None:
                 # If this frame was generated with old parameters, drop it
-                if frame.parameters.get("version", 0) < self.last_parameters_version:
+                version = frame.parameters.get("version", 0)
+                if version < self.last_parameters_version:
                     self.logger.debug(
-                        f"Dropping frame with outdated parameters version {frame.parameters.get('version', 0)} (current: {self.last_parameters_version})"
+                        "Dropping frame with outdated parameters version %s (current: %s)",
+                        version,
+                        self.last_parameters_version,
                     )
                     return
 
@@ -186,18 +188,27 @@ class LegridController:
         if not pixels:
             return
 
-        # Set each pixel
-        for i, (r, g, b) in enumerate(pixels):
-            if i < self.hardware.led_count:
-                self.hardware.set_pixel(i, r, g, b)
+        # Static patterns resend identical frames; skip the strip write then
+        if pixels == self.last_displayed_pixels:
+            return
+
+        # Hand the whole frame to the hardware in one call
+        self.hardware.set_pixels(pixels)
 
         # Show the updated pixels
         self.hardware.show()
 
+        # Keep a copy, the frame processor reuses its output list; copy into
+        # the same list so no new list is allocated per displayed frame
+        if self.last_displayed_pixels is None:
+            self.last_displayed_pixels = list(pixels)
+        else:
+            self.last_displayed_pixels[:] = pixels
+
     def _signal_handler(self, sig, frame):
         """Handle termination signals"""
         self.logger.info(f"Received signal {sig}")
-        self.running = False
+        self.shutdown_event.set()
 
 
 def parse_arguments():